@@ -1,22 +1,66 @@
 from copy import deepcopy
-from inspect import signature
-from itertools import chain, product
+from functools import lru_cache
+from inspect import Parameter, signature
+from operator import attrgetter
 from pprint import pformat
-from queue import LifoQueue
 
 import numpy as np
 
 from sklearn.base import clone
-from sklearn.utils import is_scalar_nan
+
+# Types allowed for the default values of the `__init__` parameters. It includes any
+# numpy numeric such as np.int32.
+_ALLOWED_PARAM_TYPES = frozenset(
+    {
+        str,
+        int,
+        float,
+        bool,
+        tuple,
+        type(None),
+        type,
+        *np.core.numerictypes.allTypes.values(),
+    }
+)
+_ALLOWED_PARAM_TYPE_NAMES = frozenset(t.__name__ for t in _ALLOWED_PARAM_TYPES)
+
+# Common tail of the error messages pointing to the development guide.
+_DEVELOP_GUIDE_REFERENCE = (
+    "Refer to the following development guide to implement the expected API: "
+)
+_DEVELOP_GUIDE_URL = "https://scikit-learn.org/dev/developers/develop.html"
+_CLONING_DOC_URL = f"{_DEVELOP_GUIDE_URL}#cloning"
+_PARAMETERS_INIT_DOC_URL = f"{_DEVELOP_GUIDE_URL}#parameters_init"
+_GET_SET_PARAMS_DOC_URL = f"{_DEVELOP_GUIDE_URL}#get_set_params"
+_FIT_API_DOC_URL = f"{_DEVELOP_GUIDE_URL}#fit_api"
+
+# Messages used when `check_estimator_api_clone` fails.
+_MISSING_GET_PARAMS_MARKER = "does not implement a 'get_params' method"
+_CLONE_TYPEERROR_SUFFIX = f" {_DEVELOP_GUIDE_REFERENCE}{_CLONING_DOC_URL}"
+_CLONE_WRONG_CLASS_MSG = (
+    "Cloning an estimator should return an estimator instance of the same class. "
+    "Got {cloned_name} instead of {name}. "
+    f"{_DEVELOP_GUIDE_REFERENCE}{_CLONING_DOC_URL}"
+)
+
+# Template formatted only when `check_estimator_api_set_params` fails.
+_SET_PARAMS_ADDRESS_CHANGED_MSG = (
+    "Estimator {name} does not implement properly `get_params` and"
+    "`set_params`. The parameter `{param_name}` was not set properly set. The memory "
+    f"address of the parameter changed. {_DEVELOP_GUIDE_REFERENCE}"
+    f"{_GET_SET_PARAMS_DOC_URL}"
+)
+
+
+def _is_nan(x):
+    """Check if `x` is a Python or NumPy floating NaN."""
+    # NaN is the only value that is not equal to itself
+    return isinstance(x, (float, np.floating)) and x != x
 
 
 def yield_estimator_api_checks(estimator):
-    yield check_estimator_api_clone
-    yield check_estimator_api_parameter_init
-    yield check_estimator_api_get_params
-    yield check_estimator_api_set_params
-    yield check_estimator_api_round_trip_get_set_params
-    yield check_estimator_api_fit
+    # The checks do not depend on the estimator and are defined once in `_API_CHECKS`.
+    return _API_CHECKS
 
 
 def check_estimator_api_clone(name, estimator):
@@ -28,49 +72,94 @@ def check_estimator_api_clone(name, estimator):
     try:
         cloned_estimator = clone(estimator)
     except TypeError as exc:
-        if "does not implement a 'get_params' method" in str(exc):
+        # the message of the `TypeError` raised by `clone` is its first argument
+        exc_message = exc.args[0] if exc.args and isinstance(exc.args[0], str) else ""
+        if _MISSING_GET_PARAMS_MARKER in exc_message:
             # TODO: improve the error message in `_clone_parametrized` to include a link
             # to the API documentation. We re-raise this error with this information
-            raise TypeError(
-                str(exc)
-                + " Refer to the following development guide to implement the expected "
-                "API: https://scikit-learn.org/dev/developers/develop.html#cloning"
-            ) from exc
+            raise TypeError(str(exc) + _CLONE_TYPEERROR_SUFFIX) from exc
         raise exc
 
-    assert isinstance(cloned_estimator, estimator.__class__), (
-        "Cloning an estimator should return an estimator instance of the same class. "
-        f"Got {cloned_estimator.__class__.__name__} instead of "
-        f"{name}. Refer to the following development guide to implement the expected "
-        "API: https://scikit-learn.org/dev/developers/develop.html#cloning"
-    )
+    if type(cloned_estimator) is not estimator.__class__:
+        raise AssertionError(
+            _CLONE_WRONG_CLASS_MSG.format(
+                cloned_name=cloned_estimator.__class__.__name__, name=name
+            )
+        )
+
 
+# The introspection helpers below use an unbounded cache keyed on classes or on the
+# methods defined by classes. Classes live as long as their module, so keeping a
+# reference to them in a test process does not extend the lifetime of estimators.
+@lru_cache(maxsize=None)
+def _get_init_params_from_signature(estimator_class):
+    """Function to get the parameters of the `__init__` method of a class.
 
-def _get_init_params_from_signature(estimator):
-    """Function to get the parameters of the `__init__` method."""
+    The parameters only depend on the class and are therefore cached.
+    """
     # For deprecated classes, `getattr` on `__init__` will get `"deprecated_original"`.
     # We need to workaround.
-    init_method = getattr(estimator.__init__, "deprecated_original", estimator.__init__)
+    init_method = getattr(
+        estimator_class.__init__, "deprecated_original", estimator_class.__init__
+    )
     try:
         init_params = signature(init_method).parameters
     except (TypeError, ValueError):
         # Error on builtin C function and Mixin classes
-        return []
+        return ()
+
+    init_params = tuple(init_params.values())
+    # `__init__` is taken from the class and is therefore not bound: the first
+    # positional parameter is the instance, whatever its name.
+    if init_params and init_params[0].kind in (
+        Parameter.POSITIONAL_ONLY,
+        Parameter.POSITIONAL_OR_KEYWORD,
+    ):
+        init_params = init_params[1:]
 
     # filters parameters such that it is:
     # - not `self`;
     # - not `*args`;
     # - not `**kwargs`.
-    init_params = [
+    init_params = tuple(
         param
-        for param in init_params.values()
+        for param in init_params
         if param.name not in ("self", "obj")  # "obj" is an additional parameter in PyPy
-        and param.kind != param.VAR_POSITIONAL
-        and param.kind != param.VAR_KEYWORD
-    ]
+        and param.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+    )
     return init_params
 
 
+@lru_cache(maxsize=None)
+def _get_init_params_names(estimator_class):
+    """Function to get the names of the parameters of the `__init__` method."""
+    return frozenset(
+        map(attrgetter("name"), _get_init_params_from_signature(estimator_class))
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_init_params_default_is_nan(estimator_class):
+    """Function to get whether the default of each `__init__` parameter is NaN."""
+    return tuple(
+        _is_nan(param.default)
+        for param in _get_init_params_from_signature(estimator_class)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_mro_init_params_names(estimator_class):
+    """Function to get the names of the `__init__` parameters of a class and its
+    parents."""
+    return frozenset().union(
+        *(
+            _get_init_params_names(parent)
+            for parent in estimator_class.__mro__
+            if parent is not object
+        )
+    )
+
+
 def check_estimator_api_parameter_init(name, estimator):
     """Check that an estimator passes the API regarding the `__init__` parameters.
 
@@ -85,70 +174,52 @@ def check_estimator_api_parameter_init(name, estimator):
     except RuntimeError as exc:
         raise AssertionError(
             f"Estimator {name} should not modify the input attribute in any ways. "
-            "Refer to the following development guide to implement the expected API: "
-            "https://scikit-learn.org/dev/developers/develop.html#parameters_init"
+            f"{_DEVELOP_GUIDE_REFERENCE}{_PARAMETERS_INIT_DOC_URL}"
         ) from exc
     except AttributeError as exc:
         raise AttributeError(
             f"Estimator {name} should store all parameters as an attribute during init."
-            " Refer to the following development guide to implement the expected API: "
-            "https://scikit-learn.org/dev/developers/develop.html#parameters_init"
+            f" {_DEVELOP_GUIDE_REFERENCE}{_PARAMETERS_INIT_DOC_URL}"
         ) from exc
 
-    estimator_init_params = _get_init_params_from_signature(estimator)
-    estimator_parent_init_params = chain.from_iterable(
-        _get_init_params_from_signature(parent)
-        for parent in estimator.__class__.__mro__
-    )
+    estimator_init_params = _get_init_params_from_signature(estimator.__class__)
 
     # Check that we only set attributes with the same name as in the parameters of the
     # `__init__` method. We tolerate to have additional private attributes starting
-    # with `_` as they are not considered as part of the public API.
-    estimator_init_params_names = set(param.name for param in estimator_init_params)
-    estimator_parent_init_params_names = set(
-        param.name for param in estimator_parent_init_params
-    )
-    invalid_attributes = (
-        set(vars(estimator))
-        - set(estimator_init_params_names)
-        - set(estimator_parent_init_params_names)
-    )
-    invalid_attributes = set(
-        [attr for attr in invalid_attributes if not attr.startswith("_")]
-    )
-    assert not invalid_attributes, (
-        f"Estimator {name} should not set any attribute apart from parameters during "
-        f"init. Found attributes {sorted(invalid_attributes)}."
-    )
+    # with `_` as they are not considered as part of the public API. The class itself
+    # is the first entry of the MRO and its parameters are therefore included.
+    known_params_names = _get_mro_init_params_names(estimator.__class__)
+    invalid_attributes = {
+        attr
+        for attr in estimator.__dict__
+        if not attr.startswith("_") and attr not in known_params_names
+    }
+    if invalid_attributes:
+        raise AssertionError(
+            f"Estimator {name} should not set any attribute apart from parameters "
+            f"during init. Found attributes {sorted(invalid_attributes)}."
+        )
 
     # Check the constraint apply for the init parameters. They should have:
     # - a default value;
     # - belong to a certain type;
     # - not be mutated during the `__init__` call.
-    allowed_types = {
-        str,
-        int,
-        float,
-        bool,
-        tuple,
-        type(None),
-        type,
-    }
-    # Any numpy numeric such as np.int32.
-    allowed_types.update(np.core.numerictypes.allTypes.values())
     # filter the non-default arguments
-    estimator_init_params = estimator_init_params[
-        len(getattr(estimator, "_required_parameters", [])) :
-    ]
-    estimator_get_params = estimator.get_params()
-    for param in estimator_init_params:
+    n_required_parameters = len(getattr(estimator, "_required_parameters", []))
+    estimator_init_params = zip(
+        estimator_init_params[n_required_parameters:],
+        _get_init_params_default_is_nan(estimator.__class__)[n_required_parameters:],
+    )
+    estimator_get_params = estimator.get_params(deep=False)
+    for param, default_is_nan in estimator_init_params:
         # check that init parameters have a default value
-        assert (
-            param.default != param.empty
-        ), f"Parameter {param.name} for {name} has no default value"
+        if param.default is Parameter.empty:
+            raise AssertionError(
+                f"Parameter {param.name} for {name} has no default value"
+            )
         # check that the init parameter type is allowed
         allowed_value = (
-            type(param.default) in allowed_types
+            type(param.default) in _ALLOWED_PARAM_TYPES
             or
             # Although callables are mutable, we accept them as argument
             # default value and trust that neither the implementation of
@@ -157,28 +228,35 @@ def check_estimator_api_parameter_init(name, estimator):
             callable(param.default)
         )
 
-        assert allowed_value, (
-            f"Parameter '{param.name}' of estimator "
-            f"'{name}' is of type "
-            f"{type(param.default).__name__} which is not allowed. "
-            f"'{param.name}' must be a callable or must be of type "
-            f"{set(type.__name__ for type in allowed_types)}."
-            " Refer to the following development guide to implement the expected API: "
-            "https://scikit-learn.org/dev/developers/develop.html#parameters_init"
-        )
+        if not allowed_value:
+            raise AssertionError(
+                f"Parameter '{param.name}' of estimator "
+                f"'{name}' is of type "
+                f"{type(param.default).__name__} which is not allowed. "
+                f"'{param.name}' must be a callable or must be of type "
+                f"{sorted(_ALLOWED_PARAM_TYPE_NAMES)}. {_DEVELOP_GUIDE_REFERENCE}"
+                f"{_PARAMETERS_INIT_DOC_URL}"
+            )
 
         param_value_from_get_params = estimator_get_params[param.name]
-        failure_text = (
-            f"Parameter {param.name} was mutated on init. All parameters must be "
-            "stored unchanged. Refer to the following development guide to implement "
-            "the expected API: "
-            "https://scikit-learn.org/dev/developers/develop.html#parameters_init"
+        # The default is usually stored as-is such that the identity check is enough
+        # and we only fall back to an equality comparison otherwise. A NaN default,
+        # never equal to itself, has to be the very same object.
+        unchanged_value = param_value_from_get_params is param.default or (
+            not default_is_nan and param_value_from_get_params == param.default
         )
-        if is_scalar_nan(param_value_from_get_params):
-            # Allows to set default parameters to np.nan
-            assert param_value_from_get_params is param.default, failure_text
-        else:
-            assert param_value_from_get_params == param.default, failure_text
+        if not unchanged_value:
+            raise AssertionError(
+                f"Parameter {param.name} was mutated on init. All parameters must be "
+                f"stored unchanged. {_DEVELOP_GUIDE_REFERENCE}"
+                f"{_PARAMETERS_INIT_DOC_URL}"
+            )
+
+
+@lru_cache(maxsize=None)
+def _get_params_deep_parameter(get_params_method):
+    """Function to get the `deep` parameter of a `get_params` method, if any."""
+    return signature(get_params_method).parameters.get("deep")
 
 
 def check_estimator_api_get_params(name, estimator):
@@ -194,33 +272,38 @@ def check_estimator_api_get_params(name, estimator):
     if not hasattr(estimator, "get_params"):
         raise AssertionError(
             f"Estimator {name} should have a `get_params` method. "
-            "Refer to the following development guide to implement the expected API: "
-            "https://scikit-learn.org/dev/developers/develop.html#get_set_params"
+            f"{_DEVELOP_GUIDE_REFERENCE}{_GET_SET_PARAMS_DOC_URL}"
         )
 
-    get_params_signature = signature(estimator.get_params)
-    assert "deep" in get_params_signature.parameters, (
-        f"Estimator {name} implements a `get_params` method. However this method does "
-        "not have a `deep` optional parameter. This parameter should be set to True by "
-        "by default."
-        "Refer to the following development guide to implement the expected API: "
-        "https://scikit-learn.org/dev/developers/develop.html#get_set_params"
-    )
-    assert get_params_signature.parameters["deep"].default is True, (
-        f"Estimator {name} implements a `get_params` method with the `deep` optional "
-        "parameter. However this parameter is not set to True by default and it is "
-        f"instead set to {get_params_signature.parameters['deep'].default}. "
-        "Refer to the following development guide to implement the expected API: "
-        "https://scikit-learn.org/dev/developers/develop.html#get_set_params"
-    )
+    # inspect the method defined in the class such that the signature is shared by
+    # all instances. A method only available on the instance is not cached since the
+    # bound method would keep the estimator alive.
+    if hasattr(type(estimator), "get_params"):
+        deep_parameter = _get_params_deep_parameter(type(estimator).get_params)
+    else:
+        deep_parameter = signature(estimator.get_params).parameters.get("deep")
+    if deep_parameter is None:
+        raise AssertionError(
+            f"Estimator {name} implements a `get_params` method. However this method "
+            "does not have a `deep` optional parameter. This parameter should be set "
+            f"to True by by default. {_DEVELOP_GUIDE_REFERENCE}"
+            f"{_GET_SET_PARAMS_DOC_URL}"
+        )
+    if deep_parameter.default is not True:
+        raise AssertionError(
+            f"Estimator {name} implements a `get_params` method with the `deep` "
+            "optional parameter. However this parameter is not set to True by default "
+            "and it is instead set to "
+            f"{deep_parameter.default}. "
+            f"{_DEVELOP_GUIDE_REFERENCE}{_GET_SET_PARAMS_DOC_URL}"
+        )
 
     # check the consistency between `__init__` and the output of
     # `get_params(deep=False)`
-    estimator_init_params = _get_init_params_from_signature(estimator)
+    estimator_init_params_names = _get_init_params_names(estimator.__class__)
     estimator_get_params_shallow = estimator.get_params(deep=False)
 
-    estimator_init_params_names = set(param.name for param in estimator_init_params)
-    estimator_get_params_names = set(estimator_get_params_shallow.keys())
+    estimator_get_params_names = estimator_get_params_shallow.keys()
     if estimator_init_params_names != estimator_get_params_names:
         missing_get_params = estimator_init_params_names - estimator_get_params_names
         additional_get_params = estimator_get_params_names - estimator_init_params_names
@@ -240,26 +323,27 @@ def check_estimator_api_get_params(name, estimator):
                 "method but are missing from the `__init__` method: "
                 f"{sorted(additional_get_params)}."
             )
-        msg += (
-            " Refer to the following development guide to implement the expected "
-            "API:"
-            "https://scikit-learn.org/dev/developers/develop.html#get_set_params"
-        )
+        msg += f" {_DEVELOP_GUIDE_REFERENCE}{_GET_SET_PARAMS_DOC_URL}"
         raise AssertionError(msg)
 
     # check the consistency between `get_params(deep=False)` and
     # `get_params(deep=True)`
     estimator_get_params_deep = estimator.get_params(deep=True)
-    assert all(
-        item in estimator_get_params_deep.items()
-        for item in estimator_get_params_shallow.items()
-    ), (
-        f"For estimator {name}, the parameters returned by `get_params` with "
-        "`deep=True` is not subset of the ones returned by `get_params` with "
-        "`deep=False`."
-        " Refer to the following development guide to implement the expected API: "
-        "https://scikit-learn.org/dev/developers/develop.html#get_set_params"
-    )
+    # identity is tested first, as done by the `dict.items()` membership, such that
+    # values without a boolean equality (e.g. arrays) are supported
+    if not all(
+        param_name in estimator_get_params_deep
+        and (
+            estimator_get_params_deep[param_name] is param_value
+            or estimator_get_params_deep[param_name] == param_value
+        )
+        for param_name, param_value in estimator_get_params_shallow.items()
+    ):
+        raise AssertionError(
+            f"For estimator {name}, the parameters returned by `get_params` with "
+            "`deep=True` is not subset of the ones returned by `get_params` with "
+            f"`deep=False`. {_DEVELOP_GUIDE_REFERENCE}{_GET_SET_PARAMS_DOC_URL}"
+        )
 
     # When using `get_params(deep=True)`, we need to recurse estimators to make sure
     # that we show all parameters. This test does not handle list of estimators as
@@ -268,32 +352,41 @@ def check_estimator_api_get_params(name, estimator):
     # TODO: do we want to handle such composition case? This is somehow tested in
     # round-trip get_params -> set_params -> get_params.
     if not hasattr(estimator, "_required_parameters"):
-        # this is an alternative implementation of `get_params` that uses a
-        # LIFO queue and store any estimator to get parameters from in the
-        # queue.
-        nested_estimator = LifoQueue()
-        # initialize the queue with the top-level estimator
-        nested_estimator.put((name, estimator))
-        expected_params = estimator.get_params(deep=False)
-        nesting_level = 0  # later on used to preprend the name of the parameter
-        while not nested_estimator.empty():
-            est_name, est = nested_estimator.get()
-            est_params = est.get_params(deep=False)
-            for param_name, param_value in est_params.items():
-                pname = f"{est_name}__{param_name}" if nesting_level > 0 else param_name
-                expected_params[pname] = param_value
-                if hasattr(param_value, "get_params"):
-                    # to be recurse in a later iteration
-                    nested_estimator.put((pname, param_value))
-            nesting_level += 1
-
-        assert estimator.get_params(deep=True) == expected_params, (
-            f"For estimator {name}, the parameters returned by `get_params(deep=True)` "
-            "are incorrect. We would expect the following parameters:\n"
-            f"{pformat(expected_params)}\n"
-            " Refer to the following development guide to implement the expected API: "
-            "https://scikit-learn.org/dev/developers/develop.html#get_set_params"
-        )
+        if not any(
+            hasattr(param_value, "get_params")
+            for param_value in estimator_get_params_shallow.values()
+        ):
+            # without nested estimators, deep and shallow parameters are the same
+            expected_params = estimator_get_params_shallow
+        else:
+            # this is an alternative implementation of `get_params` that uses a
+            # list as a LIFO stack and store any estimator to get parameters from in
+            # the stack.
+            # initialize the stack with the top-level estimator
+            nested_estimator = [(name, estimator)]
+            push, pop = nested_estimator.append, nested_estimator.pop
+            expected_params = {}
+            nesting_level = 0  # later on used to preprend the name of the parameter
+            while nested_estimator:
+                est_name, est = pop()
+                est_params = est.get_params(deep=False)
+                for param_name, param_value in est_params.items():
+                    pname = (
+                        f"{est_name}__{param_name}" if nesting_level > 0 else param_name
+                    )
+                    expected_params[pname] = param_value
+                    if hasattr(param_value, "get_params"):
+                        # to be recurse in a later iteration
+                        push((pname, param_value))
+                nesting_level += 1
+
+        if estimator_get_params_deep != expected_params:
+            raise AssertionError(
+                f"For estimator {name}, the parameters returned by "
+                "`get_params(deep=True)` are incorrect. We would expect the following "
+                f"parameters:\n{pformat(expected_params)}\n {_DEVELOP_GUIDE_REFERENCE}"
+                f"{_GET_SET_PARAMS_DOC_URL}"
+            )
 
 
 def check_estimator_api_set_params(name, estimator):
@@ -305,61 +398,63 @@ def check_estimator_api_set_params(name, estimator):
     if not hasattr(estimator, "set_params"):
         raise AssertionError(
             f"Estimator {name} should have a `set_params` method. "
-            "Refer to the following development guide to implement the expected API: "
-            "https://scikit-learn.org/dev/developers/develop.html#get_set_params"
+            f"{_DEVELOP_GUIDE_REFERENCE}{_GET_SET_PARAMS_DOC_URL}"
         )
 
     # check that set_params returns self
     # make a deep clone since `set_params` could modify the state of the estimator
     cloned_estimator = deepcopy(estimator)
-    assert cloned_estimator.set_params() is cloned_estimator, (
-        f"Estimator {name} does not return `self` from `set_params`. "
-        "Refer to the following development guide to implement the expected API: "
-        "https://scikit-learn.org/dev/developers/develop.html#get_set_params"
-    )
+    if cloned_estimator.set_params() is not cloned_estimator:
+        raise AssertionError(
+            f"Estimator {name} does not return `self` from `set_params`. "
+            f"{_DEVELOP_GUIDE_REFERENCE}{_GET_SET_PARAMS_DOC_URL}"
+        )
 
-    all_param_names = estimator.get_params(deep=False).keys()
+    estimator_params = estimator.get_params(deep=False)
+    all_param_names = estimator_params.keys()
     # Try different type of values that we can easily detect. Since there is no
     # validation in `set_params` we can pass anything.
     test_values = [-np.inf, np.inf, None]
 
-    for param_name, test_value in product(all_param_names, test_values):
-        # make a deepcopy of the original estimator since we are going to change nested
-        # parameter that will not be copied using `clone`
+    for param_name in all_param_names:
+        # make a deep clone since `set_params` could modify the state of the estimator
         cloned_estimator = deepcopy(estimator)
-        original_params = cloned_estimator.get_params(deep=False).copy()
+        # bind the methods called for each test value
+        get_params = cloned_estimator.get_params
+        set_params = cloned_estimator.set_params
+        original_params = get_params(deep=False).copy()
+        original_params_name = original_params.keys()
         # make a round-trip to make sure that the estimator is not modified by
-        cloned_estimator.set_params(**original_params)
-        # set specifically the current parameter
-        cloned_estimator.set_params(**{param_name: test_value})
-
-        current_params = cloned_estimator.get_params(deep=False)
-        original_params_name = set(original_params.keys())
-        current_params_name = set(current_params.keys())
-        assert original_params_name == current_params_name, (
-            f"Estimator {name} does not implement properly `get_params` and"
-            "`set_params`. After setting parameters, `get_params` does not return the "
-            "same set of parameters. The problematic parameter(s) is(are): "
-            f"{original_params_name.symmetric_difference(current_params_name)}. "
-            "Refer to the following development guide to implement the expected API: "
-            "https://scikit-learn.org/dev/developers/develop.html#get_set_params"
-        )
-        msg = (
-            "Estimator {0} does not implement properly `get_params` and"
-            "`set_params`. The parameter `{1}` was not set properly set. The memory "
-            "address of the parameter changed. "
-            "Refer to the following development guide to implement the expected API: "
-            "https://scikit-learn.org/dev/developers/develop.html#get_set_params"
-        )
-        for current_param_name, current_param_value in current_params.items():
-            if current_param_name is param_name:
-                assert current_param_value is test_value, msg.format(
-                    name, current_param_name
+        set_params(**original_params)
+
+        # each test value overwrites the same parameter such that we can reuse the
+        # same estimator for all of them
+        for test_value in test_values:
+            # set specifically the current parameter
+            set_params(**{param_name: test_value})
+
+            current_params = get_params(deep=False)
+            current_params_name = current_params.keys()
+            if original_params_name != current_params_name:
+                raise AssertionError(
+                    f"Estimator {name} does not implement properly `get_params` and"
+                    "`set_params`. After setting parameters, `get_params` does not "
+                    "return the same set of parameters. The problematic parameter(s) "
+                    "is(are): "
+                    f"{original_params_name ^ current_params_name}"
+                    f". {_DEVELOP_GUIDE_REFERENCE}{_GET_SET_PARAMS_DOC_URL}"
                 )
-            else:
-                assert (
-                    current_param_value is original_params[current_param_name]
-                ), msg.format(name, current_param_name)
+            for current_param_name, current_param_value in current_params.items():
+                if current_param_name is param_name:
+                    expected_param_value = test_value
+                else:
+                    expected_param_value = original_params[current_param_name]
+                if current_param_value is not expected_param_value:
+                    raise AssertionError(
+                        _SET_PARAMS_ADDRESS_CHANGED_MSG.format(
+                            name=name, param_name=current_param_name
+                        )
+                    )
 
 
 def check_estimator_api_round_trip_get_set_params(name, estimator):
@@ -372,21 +467,22 @@ def check_estimator_api_round_trip_get_set_params(name, estimator):
     """
     # Make an original deepcopy of the parameters that are used in `set_params`. In this
     # way, they will not be impacted by a wrong `set_params` implementation that changes
-    # the internal state of the estimator.
+    # the internal state of the estimator. Passing fresh objects to `set_params` also
+    # ensures that they are actually stored by the estimator.
     original_params = deepcopy(estimator.get_params(deep=True))
     estimator.set_params(**original_params)
     updated_params = estimator.get_params(deep=True)
 
-    original_params_name = set(original_params.keys())
-    updated_params_name = set(updated_params.keys())
-    assert original_params_name == updated_params_name, (
-        f"Estimator {name} does not implement properly `get_params` and `set_params`. "
-        "The names of the parameters does not correspond after a round-trip "
-        "get_params/set_params. The problematic parameter(s) is(are): "
-        f"{original_params_name.symmetric_difference(updated_params_name)}. "
-        "Refer to the following development guide to implement the expected API: "
-        "https://scikit-learn.org/dev/developers/develop.html#get_set_params"
-    )
+    original_params_name = original_params.keys()
+    updated_params_name = updated_params.keys()
+    if original_params_name != updated_params_name:
+        raise AssertionError(
+            f"Estimator {name} does not implement properly `get_params` and "
+            "`set_params`. The names of the parameters does not correspond after a "
+            "round-trip get_params/set_params. The problematic parameter(s) is(are): "
+            f"{original_params_name ^ updated_params_name}. "
+            f"{_DEVELOP_GUIDE_REFERENCE}{_GET_SET_PARAMS_DOC_URL}"
+        )
 
     for updated_param_name, updated_param_value in updated_params.items():
         if (
@@ -403,23 +499,21 @@ def check_estimator_api_round_trip_get_set_params(name, estimator):
                 updated_param_value, original_params[updated_param_name]
             ):
                 for elt_updated, elt_original in zip(tuple_updated, tuple_original):
-                    assert elt_updated is elt_original, (
-                        f"Estimator {name} does not implement properly `get_params` "
-                        "and `set_params`. The memory address of inner parameters has "
-                        f"changed for the parameter `{updated_param_name}`. "
-                        "Refer to the following development guide to implement the "
-                        "expected API: https://scikit-learn.org/dev/developers/"
-                        "develop.html#get_set_params"
-                    )
-        else:
-            assert original_params[updated_param_name] is updated_param_value, (
+                    if elt_updated is not elt_original:
+                        raise AssertionError(
+                            f"Estimator {name} does not implement properly "
+                            "`get_params` and `set_params`. The memory address of "
+                            "inner parameters has changed for the parameter "
+                            f"`{updated_param_name}`. {_DEVELOP_GUIDE_REFERENCE}"
+                            f"{_GET_SET_PARAMS_DOC_URL}"
+                        )
+        elif original_params[updated_param_name] is not updated_param_value:
+            raise AssertionError(
                 f"Estimator {name} does not implement properly `get_params` and "
                 "`set_params`. Implementing a round-trip get_params/set_params does "
                 "not return the exact same object. The memory address of the parameter "
-                f"`{updated_param_name}` has changed. "
-                "Refer to the following development guide to implement the expected "
-                "API: https://scikit-learn.org/dev/developers/"
-                "develop.html#get_set_params"
+                f"`{updated_param_name}` has changed. {_DEVELOP_GUIDE_REFERENCE}"
+                f"{_GET_SET_PARAMS_DOC_URL}"
             )
 
 
@@ -432,11 +526,20 @@ def check_estimator_api_fit(name, estimator):
     if not hasattr(estimator, "fit"):
         raise AssertionError(
             f"Estimator {name} does not implement a `fit` method. "
-            "Refer to the following development guide to implement the expected API: "
-            "https://scikit-learn.org/dev/developers/develop.html#fit_api"
+            f"{_DEVELOP_GUIDE_REFERENCE}{_FIT_API_DOC_URL}"
         )
 
 
+_API_CHECKS = (
+    check_estimator_api_clone,
+    check_estimator_api_parameter_init,
+    check_estimator_api_get_params,
+    check_estimator_api_set_params,
+    check_estimator_api_round_trip_get_set_params,
+    check_estimator_api_fit,
+)
+
+
 # @ignore_warnings(category=FutureWarning)
 # def check_dont_overwrite_parameters(name, estimator_orig):
 #     # check that fit method only changes or sets private attributes
@@ -1,10 +1,10 @@
-from copy import deepcopy
+import re
+from copy import copy
 
-import numpy as np
+import pytest
 
-from sklearn.base import BaseEstimator
+from sklearn.base import BaseEstimator, clone
 from sklearn.utils.metaestimators import _BaseComposition
-from sklearn.utils._testing import raises
 
 from sklearn_common_tests._minimal_estimator import (
     EstimatorWithGetSetParams,
@@ -23,13 +23,15 @@ from sklearn_common_tests._api.estimator import (
 )
 
 
-def test_check_estimator_api_clone():
+@pytest.mark.parametrize(
+    "Estimator", [EstimatorWithGetSetParams, EstimatorWithSklearnClone]
+)
+def test_check_estimator_api_clone(Estimator):
     """Check that estimator implementing the scikit-learn cloning API are passing the
     cloning test.
     """
-    for Estimator in (EstimatorWithGetSetParams, EstimatorWithSklearnClone):
-        estimator = Estimator()
-        check_estimator_api_clone(estimator.__class__.__name__, estimator)
+    estimator = Estimator()
+    check_estimator_api_clone(estimator.__class__.__name__, estimator)
 
 
 class EstimatorNoGetSetParams:
@@ -49,28 +51,50 @@ class EstimatorWrongSklearnClone:
         return "xxx"
 
 
-def test_check_estimator_api_clone_error():
-    """Check handling of estimators that does not implement or wrongly implement the
-    scikit-learn cloning API.
-    """
-    # parametrization with a tuple of (Estimator, type_error, error_message)
-    parametrize = [
-        (
-            EstimatorNoGetSetParams,
-            TypeError,
-            "does not implement a 'get_params' method",
+class EstimatorSklearnCloneSubclass(EstimatorWithSklearnClone):
+    """Estimator returning an instance of a subclass when cloning."""
+
+    def __sklearn_clone__(self):
+        return _EstimatorSklearnCloneSubclassChild(param=self.param)
+
+
+class _EstimatorSklearnCloneSubclassChild(EstimatorSklearnCloneSubclass):
+    """Subclass returned by `EstimatorSklearnCloneSubclass.__sklearn_clone__`."""
+
+
+# parametrization with a tuple of (Estimator, type_error, error_message)
+PARAMETRIZE_CLONE_ERRORS = [
+    (
+        EstimatorNoGetSetParams,
+        TypeError,
+        re.compile("does not implement a 'get_params' method"),
+    ),
+    (
+        EstimatorWrongSklearnClone,
+        AssertionError,
+        re.compile(
+            "Cloning an estimator should return an estimator instance of the same"
         ),
-        (
-            EstimatorWrongSklearnClone,
-            AssertionError,
-            "Cloning an estimator should return an estimator instance of the same",
+    ),
+    (
+        EstimatorSklearnCloneSubclass,
+        AssertionError,
+        re.compile(
+            "Got _EstimatorSklearnCloneSubclassChild instead of "
+            "EstimatorSklearnCloneSubclass"
         ),
-    ]
+    ),
+]
 
-    for Estimator, type_err, err_msg in parametrize:
-        estimator = Estimator()
-        with raises(type_err, match=err_msg):
-            check_estimator_api_clone(estimator.__class__.__name__, estimator)
+
+@pytest.mark.parametrize("Estimator, type_err, err_msg", PARAMETRIZE_CLONE_ERRORS)
+def test_check_estimator_api_clone_error(Estimator, type_err, err_msg):
+    """Check handling of estimators that does not implement or wrongly implement the
+    scikit-learn cloning API.
+    """
+    estimator = Estimator()
+    with pytest.raises(type_err, match=err_msg):
+        check_estimator_api_clone(estimator.__class__.__name__, estimator)
 
 
 class EstimatorWithPrivateAttributes(EstimatorArgsOptionalArgs):
@@ -81,13 +105,30 @@ class EstimatorWithPrivateAttributes(EstimatorArgsOptionalArgs):
         self._private_attribute = 1
 
 
-def test_check_estimator_api_parameter_init():
+class EstimatorInstanceNotNamedSelf(EstimatorWithGetSetParams):
+    """Estimator naming the instance argument of `__init__` differently than
+    `self`."""
+
+    def __init__(this, param=None):
+        this.param = param
+
+
+@pytest.mark.parametrize(
+    "Estimator, params",
+    [
+        (EstimatorWithGetSetParams, {}),
+        (EstimatorWithFit, {}),
+        (EstimatorInstanceNotNamedSelf, {}),
+        (EstimatorArgsOptionalArgs, {"arg1": 1}),
+        (EstimatorWithPrivateAttributes, {"arg1": 1}),
+    ],
+)
+def test_check_estimator_api_parameter_init(Estimator, params):
     """Check that estimator implementing the regular parameter init are passing the
     parameter init test.
     """
-    for Estimator in (EstimatorArgsOptionalArgs, EstimatorWithPrivateAttributes):
-        estimator = Estimator(1)
-        check_estimator_api_parameter_init(estimator.__class__.__name__, estimator)
+    estimator = Estimator(**params)
+    check_estimator_api_parameter_init(estimator.__class__.__name__, estimator)
 
 
 class EstimatorNotStoringParams(BaseEstimator):
@@ -109,7 +150,8 @@ class EstimatorCopyingInInit(BaseEstimator):
     """Estimator that validate attribute in `__init__`."""
 
     def __init__(self, param):
-        self.param = deepcopy(param)
+        # a shallow copy is enough to change the identity of the parameter
+        self.param = copy(param)
 
 
 class EstimatorMutableInitAttributes(BaseEstimator):
@@ -119,65 +161,83 @@ class EstimatorMutableInitAttributes(BaseEstimator):
         self.param = param
 
 
+# Single NaN object, like `np.nan`, such that `clone` sees the same parameter
+# object and the check fails on the mutation of the default instead.
+_NAN = float("nan")
+
+
 class EstimatorModifyDefaultAttribute(BaseEstimator):
     """Estimator that create modify a default parameter in `__init__`."""
 
     def __init__(self, *, param=None, replace_by_nan=True):
         if replace_by_nan:
-            self.param = np.nan
+            self.param = _NAN
         else:
             self.param = "random"
         self.replace_by_nan = replace_by_nan
 
 
-def test_check_estimator_api_parameter_init_error():
+# parametrization with a tuple (Estimator, params, type_error, error_message)
+PARAMETRIZE_PARAMETER_INIT_ERRORS = [
+    (
+        EstimatorNotStoringParams,
+        {},
+        AttributeError,
+        re.compile("should store all parameters as an attribute during init."),
+    ),
+    (
+        EstimatorAdditionalParams,
+        {},
+        AssertionError,
+        re.compile("should not set any attribute apart from parameters during init."),
+    ),
+    (
+        EstimatorCopyingInInit,
+        {"param": [1, 2, 3]},
+        AssertionError,
+        re.compile("should not modify the input attribute in any ways"),
+    ),
+    (
+        EstimatorMutableInitAttributes,
+        {},
+        AssertionError,
+        re.compile("is of type list which is not allowed"),
+    ),
+    (
+        EstimatorModifyDefaultAttribute,
+        {"replace_by_nan": True},
+        AssertionError,
+        re.compile("param was mutated on init"),
+    ),
+    (
+        EstimatorModifyDefaultAttribute,
+        {"replace_by_nan": False},
+        AssertionError,
+        re.compile("param was mutated on init"),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "Estimator, params, type_err, err_msg", PARAMETRIZE_PARAMETER_INIT_ERRORS
+)
+def test_check_estimator_api_parameter_init_error(Estimator, params, type_err, err_msg):
     """Check handling of estimators that does not implement or wrongly implement the
     regular parameter init.
     """
-    # parametrization with a tuple (estimator, type_error, error_message)
-    parametrize = [
-        (
-            EstimatorNotStoringParams(),
-            AttributeError,
-            "should store all parameters as an attribute during init.",
-        ),
-        (
-            EstimatorAdditionalParams(),
-            AssertionError,
-            "should not set any attribute apart from parameters during init.",
-        ),
-        (
-            EstimatorCopyingInInit(param=[1, 2, 3]),
-            AssertionError,
-            "should not modify the input attribute in any ways",
-        ),
-        (
-            EstimatorMutableInitAttributes(),
-            AssertionError,
-            "is of type list which is not allowed",
-        ),
-        (
-            EstimatorModifyDefaultAttribute(replace_by_nan=True),
-            AssertionError,
-            "param was mutated on init",
-        ),
-        (
-            EstimatorModifyDefaultAttribute(replace_by_nan=False),
-            AssertionError,
-            "param was mutated on init",
-        ),
-    ]
-
-    for estimator, type_err, err_msg in parametrize:
-        with raises(type_err, match=err_msg):
-            check_estimator_api_parameter_init(estimator.__class__.__name__, estimator)
+    estimator = Estimator(**params)
+    with pytest.raises(type_err, match=err_msg):
+        check_estimator_api_parameter_init(estimator.__class__.__name__, estimator)
 
 
-def test_check_estimator_api_get_params():
+@pytest.mark.parametrize(
+    "Estimator",
+    [BaseEstimator, EstimatorWithGetSetParams, EstimatorInstanceNotNamedSelf],
+)
+def test_check_estimator_api_get_params(Estimator):
     """Check that an estimator implementing `get_params` specs does not fail."""
-    for Estimator in (BaseEstimator, EstimatorWithGetSetParams):
-        estimator = Estimator()
-        check_estimator_api_get_params(estimator.__class__.__name__, estimator)
+    estimator = Estimator()
+    check_estimator_api_get_params(estimator.__class__.__name__, estimator)
 
 
 class EstimatorGetParamsWithoutDeep:
@@ -235,51 +295,68 @@ class EstimatorGetParamsWrongDeepMode:
         return {"param": self.param, "estimator": self.estimator}
 
 
-def test_check_estimator_api_get_params_error():
-    """Check that an estimator that doesn't implement the `get_params` specs fails."""
-    # parametrization with a tuple (estimator, type_error, error_message)
-    parametrize = [
-        (
-            EstimatorNoGetSetParams(),
-            AssertionError,
-            "should have a `get_params` method",
-        ),
-        (
-            EstimatorGetParamsWithoutDeep(),
-            AssertionError,
-            "method does not have a `deep` optional parameter",
+# parametrization with a tuple (Estimator, params, type_error, error_message)
+PARAMETRIZE_GET_PARAMS_ERRORS = [
+    (
+        EstimatorNoGetSetParams,
+        {},
+        AssertionError,
+        re.compile("should have a `get_params` method"),
+    ),
+    (
+        EstimatorGetParamsWithoutDeep,
+        {},
+        AssertionError,
+        re.compile("method does not have a `deep` optional parameter"),
+    ),
+    (
+        EstimatorGetParamsDeepWrongDefault,
+        {},
+        AssertionError,
+        re.compile("this parameter is not set to True by default"),
+    ),
+    (
+        EstimatorGetParamsNotEquivalentInit,
+        {},
+        AssertionError,
+        re.compile(
+            "the parameters between the `__init__` method and the `get_params` method"
         ),
-        (
-            EstimatorGetParamsDeepWrongDefault(),
-            AssertionError,
-            "this parameter is not set to True by default",
+    ),
+    (
+        EstimatorGetParamsNotSubsetDeep,
+        {},
+        AssertionError,
+        re.compile(
+            "is not subset of the ones returned by `get_params` with `deep=False`"
         ),
-        (
-            EstimatorGetParamsNotEquivalentInit(),
-            AssertionError,
-            "the parameters between the `__init__` method and the `get_params` method",
+    ),
+    (
+        EstimatorGetParamsWrongDeepMode,
+        {"estimator": EstimatorWithGetSetParams()},
+        AssertionError,
+        re.compile(
+            r"the parameters returned by `get_params\(deep=True\)` are incorrect"
         ),
-        (
-            EstimatorGetParamsNotSubsetDeep(),
-            AssertionError,
-            "is not subset of the ones returned by `get_params` with `deep=False`",
-        ),
-        (
-            EstimatorGetParamsWrongDeepMode(estimator=EstimatorWithGetSetParams()),
-            AssertionError,
-            r"the parameters returned by `get_params\(deep=True\)` are incorrect",
-        ),
-    ]
-    for estimator, type_err, err_msg in parametrize:
-        with raises(type_err, match=err_msg):
-            check_estimator_api_get_params(estimator.__class__.__name__, estimator)
+    ),
+]
 
 
-def test_check_estimator_api_set_params():
+@pytest.mark.parametrize(
+    "Estimator, params, type_err, err_msg", PARAMETRIZE_GET_PARAMS_ERRORS
+)
+def test_check_estimator_api_get_params_error(Estimator, params, type_err, err_msg):
+    """Check that an estimator that doesn't implement the `get_params` specs fails."""
+    estimator = Estimator(**params)
+    with pytest.raises(type_err, match=err_msg):
+        check_estimator_api_get_params(estimator.__class__.__name__, estimator)
+
+
+@pytest.mark.parametrize("Estimator", [BaseEstimator, EstimatorWithGetSetParams])
+def test_check_estimator_api_set_params(Estimator):
     """Check that an estimator implementing `set_params` specs does not fail."""
-    for Estimator in (BaseEstimator, EstimatorWithGetSetParams):
-        estimator = Estimator()
-        check_estimator_api_set_params(estimator.__class__.__name__, estimator)
+    estimator = Estimator()
+    check_estimator_api_set_params(estimator.__class__.__name__, estimator)
 
 
 class EstimatorSetParamsDoesNotReturnSelf:
@@ -320,50 +397,60 @@ class EstimatorSetParamsCopy(BaseEstimator):
 
     def set_params(self, **params):
         for param_name, param_value in params.items():
-            setattr(self, param_name, deepcopy(param_value))
+            # a shallow copy is enough to change the identity of the parameter
+            setattr(self, param_name, copy(param_value))
         return self
 
 
-def test_check_estimator_api_set_params_error():
+# parametrization with a tuple (Estimator, params, type_error, error_message)
+PARAMETRIZE_SET_PARAMS_ERRORS = [
+    (
+        EstimatorNoGetSetParams,
+        {},
+        AssertionError,
+        re.compile("should have a `set_params` method"),
+    ),
+    (
+        EstimatorSetParamsDoesNotReturnSelf,
+        {},
+        AssertionError,
+        re.compile("does not return `self` from `set_params`"),
+    ),
+    (
+        # TODO: the implementation of `BaseEstimator.get_params` would not detect
+        # this problem.
+        EstimatorSetParamsCreateNewParam,
+        {},
+        AssertionError,
+        re.compile("`get_params` does not return the same set of parameters"),
+    ),
+    (
+        EstimatorSetParamsCopy,
+        {"param1": BaseEstimator(), "param2": 1},
+        AssertionError,
+        re.compile("The memory address of the parameter changed"),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "Estimator, params, type_err, err_msg", PARAMETRIZE_SET_PARAMS_ERRORS
+)
+def test_check_estimator_api_set_params_error(Estimator, params, type_err, err_msg):
     """Check that an estimator that doesn't implement the `set_params` specs fails."""
-    # parametrization with a tuple (estimator, type_error, error_message)
-    parametrize = [
-        (
-            EstimatorNoGetSetParams(),
-            AssertionError,
-            "should have a `set_params` method",
-        ),
-        (
-            EstimatorSetParamsDoesNotReturnSelf(),
-            AssertionError,
-            "does not return `self` from `set_params`",
-        ),
-        (
-            # TODO: the implementation of `BaseEstimator.get_params` would not detect
-            # this problem.
-            EstimatorSetParamsCreateNewParam(),
-            AssertionError,
-            "`get_params` does not return the same set of parameters",
-        ),
-        (
-            EstimatorSetParamsCopy(param1=BaseEstimator(), param2=1),
-            AssertionError,
-            "The memory address of the parameter changed",
-        ),
-    ]
-    for estimator, type_err, err_msg in parametrize:
-        with raises(type_err, match=err_msg):
-            check_estimator_api_set_params(estimator.__class__.__name__, estimator)
+    estimator = Estimator(**params)
+    with pytest.raises(type_err, match=err_msg):
+        check_estimator_api_set_params(estimator.__class__.__name__, estimator)
 
 
-def test_check_estimator_api_round_trip_get_set_params():
+@pytest.mark.parametrize("Estimator", [BaseEstimator, EstimatorWithGetSetParams])
+def test_check_estimator_api_round_trip_get_set_params(Estimator):
     """Check that an estimator implementing `get_params` and `set_params` specs does
     a proper round trip."""
-    for Estimator in (BaseEstimator, EstimatorWithGetSetParams):
-        estimator = Estimator()
-        check_estimator_api_round_trip_get_set_params(
-            estimator.__class__.__name__, estimator
-        )
+    estimator = Estimator()
+    check_estimator_api_round_trip_get_set_params(
+        estimator.__class__.__name__, estimator
+    )
 
 
 class EstimatorSetParamsModifyInnerParamComposition(_BaseComposition):
@@ -389,42 +476,72 @@ class EstimatorSetParamsModifyInnerParamComposition(_BaseComposition):
         new_estimators = list(getattr(self, attr))
         for i, (estimator_name, _) in enumerate(new_estimators):
             if estimator_name == name:
-                # Making a deepcopy of the inner estimator
-                new_estimators[i] = (name, deepcopy(new_val))
+                # Making a copy of the inner estimator
+                new_val = (
+                    clone(new_val) if hasattr(new_val, "get_params") else copy(new_val)
+                )
+                new_estimators[i] = (name, new_val)
                 break
         setattr(self, attr, new_estimators)
 
 
-def test_check_estimator_api_round_trip_get_set_params_error():
+class EstimatorSetParamsNoOp(BaseEstimator):
+    """Check that an estimator ignoring the parameters given to `set_params` fails."""
+
+    def __init__(self, *, param1=None, param2=2):
+        self.param1 = param1
+        self.param2 = param2
+
+    def set_params(self, **params):
+        return self
+
+
+# parametrization with a tuple (Estimator, params, type_error, error_message)
+PARAMETRIZE_ROUND_TRIP_GET_SET_PARAMS_ERRORS = [
+    (
+        # TODO: the implementation of `BaseEstimator.get_params` would not detect
+        # this problem.
+        EstimatorSetParamsCreateNewParam,
+        {},
+        AssertionError,
+        re.compile(
+            "The names of the parameters does not correspond after a round-trip"
+        ),
+    ),
+    (
+        EstimatorSetParamsCopy,
+        {"param1": BaseEstimator(), "param2": 1},
+        AssertionError,
+        re.compile("The memory address of the parameter `param1` has changed"),
+    ),
+    (
+        EstimatorSetParamsModifyInnerParamComposition,
+        {"param": [("estimator", BaseEstimator())]},
+        AssertionError,
+        re.compile("The memory address of inner parameters has changed"),
+    ),
+    (
+        EstimatorSetParamsNoOp,
+        {"param1": [1, 2]},
+        AssertionError,
+        re.compile("The memory address of the parameter `param1` has changed"),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "Estimator, params, type_err, err_msg", PARAMETRIZE_ROUND_TRIP_GET_SET_PARAMS_ERRORS
+)
+def test_check_estimator_api_round_trip_get_set_params_error(
+    Estimator, params, type_err, err_msg
+):
     """Check that an estimator that does not implement properly `get_params` and
     `set_params` specs will fail during a round trip."""
-    # parametrization with a tuple (estimator, type_error, error_message)
-    parametrize = [
-        (
-            # TODO: the implementation of `BaseEstimator.get_params` would not detect
-            # this problem.
-            EstimatorSetParamsCreateNewParam(),
-            AssertionError,
-            "The names of the parameters does not correspond after a round-trip",
-        ),
-        (
-            EstimatorSetParamsCopy(param1=BaseEstimator(), param2=1),
-            AssertionError,
-            "The memory address of the parameter `param1` has changed",
-        ),
-        (
-            EstimatorSetParamsModifyInnerParamComposition(
-                param=[("estimator", BaseEstimator())]
-            ),
-            AssertionError,
-            "The memory address of inner parameters has changed",
-        ),
-    ]
-    for estimator, type_err, err_msg in parametrize:
-        with raises(type_err, match=err_msg):
-            check_estimator_api_round_trip_get_set_params(
-                estimator.__class__.__name__, estimator
-            )
+    estimator = Estimator(**params)
+    with pytest.raises(type_err, match=err_msg):
+        check_estimator_api_round_trip_get_set_params(
+            estimator.__class__.__name__, estimator
+        )
 
 
 def test_check_estimator_api_fit():
@@ -439,11 +556,22 @@ class EstimatorNotImplementingFit(EstimatorWithGetSetParams):
     """Estimator that does not implement the fit method."""
 
 
-def test_check_estimator_api_fit_error():
+# parametrization with a tuple (Estimator, params, type_error, error_message)
+PARAMETRIZE_FIT_ERRORS = [
+    (
+        EstimatorNotImplementingFit,
+        {},
+        AssertionError,
+        re.compile("does not implement a `fit` method"),
+    ),
+]
+
+
+@pytest.mark.parametrize("Estimator, params, type_err, err_msg", PARAMETRIZE_FIT_ERRORS)
+def test_check_estimator_api_fit_error(Estimator, params, type_err, err_msg):
     """Check that estimator not implementing or wrongly implement the fit API specs are
     failing the fit test.
     """
-    err_msg = "does not implement a `fit` method"
-    estimator = EstimatorNotImplementingFit()
-    with raises(AssertionError, match=err_msg):
+    estimator = Estimator(**params)
+    with pytest.raises(type_err, match=err_msg):
         check_estimator_api_fit(estimator.__class__.__name__, estimator)
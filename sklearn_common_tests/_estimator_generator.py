@@ -1,4 +1,5 @@
 import warnings
+from functools import lru_cache
 
 from sklearn.base import RegressorMixin
 from sklearn.exceptions import SkipTestWarning
@@ -16,13 +17,15 @@ from sklearn.utils._testing import SkipTest
 
 
 # These estimators are special cases and should be tested separately
-SKIPPED_ESTIMATORS = [
-    "ColumnTransformer",
-    "FeatureUnion",
-    "GridSearchCV",
-    "Pipeline",
-    "RandomizedSearchCV",
-]
+SKIPPED_ESTIMATORS = frozenset(
+    {
+        "ColumnTransformer",
+        "FeatureUnion",
+        "GridSearchCV",
+        "Pipeline",
+        "RandomizedSearchCV",
+    }
+)
 
 
 def construct_instance(Estimator):
@@ -69,7 +72,14 @@ def construct_instance(Estimator):
     return estimator
 
 
+@lru_cache(maxsize=None)
 def _tested_estimators(type_filter=None):
+    """Construct the estimators to be tested.
+
+    The estimators are constructed once per process and returned as a tuple.
+    `type_filter` should therefore be hashable, i.e. a string or a tuple.
+    """
+    estimators = []
     for _, Estimator in all_estimators(type_filter=type_filter):
         if Estimator.__name__ in SKIPPED_ESTIMATORS:
             continue
@@ -78,4 +88,5 @@ def _tested_estimators(type_filter=None):
         except SkipTest:
             continue
 
-        yield estimator
+        estimators.append(estimator)
+    return tuple(estimators)
@@ -9,13 +9,17 @@ from sklearn.utils.estimator_checks import (
 def parametrize_with_checks(estimators, checks):
     import pytest
 
-    def checks_generator():
-        for estimator in estimators:
-            name = type(estimator).__name__
-            for check in checks(estimator):
-                check = partial(check, name)
-                yield _maybe_mark_xfail(estimator, check, pytest)
+    # The pairs are materialized once such that pytest does not have to consume a
+    # generator. `partial` is kept on purpose since `_maybe_mark_xfail` relies on
+    # `partial.func` to get the name of the check.
+    # The ids are computed once per estimator instead of once per pair.
+    estimator_check_pairs, ids = [], []
+    for estimator in estimators:
+        name = type(estimator).__name__
+        estimator_id = _get_check_estimator_ids(estimator)
+        for check in checks(estimator):
+            ids.append(f"{estimator_id}-{_get_check_estimator_ids(check)}")
+            check = partial(check, name)
+            estimator_check_pairs.append(_maybe_mark_xfail(estimator, check, pytest))
 
-    return pytest.mark.parametrize(
-        "estimator, check", checks_generator(), ids=_get_check_estimator_ids
-    )
+    return pytest.mark.parametrize("estimator, check", estimator_check_pairs, ids=ids)